@@ -0,0 +1,98 @@
+"""
+_chunks_numba.py
+
+Optional Numba-accelerated tokenizer for FountainElement.split_to_chunks,
+useful when parsing many scripts in a batch. Importing this module fails
+with ImportError when numba or numpy is missing; fountain.py then falls
+back to the pure-Python tokenizer.
+"""
+
+import numpy as np
+from numba import njit
+
+BOLD = 1
+ITALIC = 2
+UNDERLINE = 4
+
+_STAR = ord('*')
+_UNDERSCORE = ord('_')
+_BACKSLASH = ord('\\')
+
+
+@njit(cache=True)
+def tokenize(buf):
+    """Tokenize a uint8 UTF-8 buffer into (start, length, flags) rows.
+
+    A row is emitted whenever the style flags change or an escape breaks
+    the run of text; rows with equal flags are meant to be folded back
+    together by the caller. Trailing unapplied star runs are dropped,
+    matching the pure-Python tokenizer.
+    """
+    n = buf.shape[0]
+    segs = np.empty((n + 1, 3), dtype=np.int32)
+    count = 0
+    flags = 0
+    seg_start = 0
+    seg_len = 0
+    stars = 0
+    i = 0
+    while i < n:
+        b = buf[i]
+
+        if b == _BACKSLASH and i + 1 >= n:
+            # dangling escape at end of text is dropped, without
+            # applying any pending star run
+            break
+
+        if stars > 0 and b != _STAR:
+            # the star run is closed by any other byte
+            if stars == 3:
+                flags ^= BOLD | ITALIC
+            elif stars == 2:
+                flags ^= BOLD
+            elif stars == 1:
+                flags ^= ITALIC
+            stars = 0
+            seg_start = i
+            seg_len = 0
+
+        if b == _BACKSLASH:
+            segs[count, 0] = seg_start
+            segs[count, 1] = seg_len
+            segs[count, 2] = flags
+            count += 1
+            segs[count, 0] = i + 1
+            segs[count, 1] = 1
+            segs[count, 2] = flags
+            count += 1
+            i += 2
+            seg_start = i
+            seg_len = 0
+        elif b == _UNDERSCORE:
+            segs[count, 0] = seg_start
+            segs[count, 1] = seg_len
+            segs[count, 2] = flags
+            count += 1
+            flags ^= UNDERLINE
+            i += 1
+            seg_start = i
+            seg_len = 0
+        elif b == _STAR:
+            if stars == 0:
+                segs[count, 0] = seg_start
+                segs[count, 1] = seg_len
+                segs[count, 2] = flags
+                count += 1
+                seg_start = i
+                seg_len = 0
+            stars += 1
+            i += 1
+        else:
+            seg_len += 1
+            i += 1
+
+    segs[count, 0] = seg_start
+    segs[count, 1] = seg_len
+    segs[count, 2] = flags
+    count += 1
+    return segs[:count]
@@ -13,8 +13,17 @@ Further Edited by Manuel Senfft
 Further Edited by Ian Thomas
 """
 
+import re
 from enum import Enum
 
+# Optional Numba-compiled tokenizer for split_to_chunks; the pure-Python
+# tokenizer is used when numba/numpy are not installed.
+try:
+    from ._chunks_numba import tokenize as _tokenize_chunks
+    import numpy as _np
+except ImportError:
+    _tokenize_chunks = None
+
 # Element Types
 class Element(Enum):
     EMPTY = 1
@@ -31,14 +40,100 @@ class Element(Enum):
     DIALOGUE = 12
 
 
+# Bitmask over Element values for the "empty-like" kinds; a shift-and
+# replaces three enum comparisons when an element is constructed.
+_EMPTY_MASK = (
+    1 << Element.EMPTY.value
+    | 1 << Element.PAGE_BREAK.value
+    | 1 << Element.BONEYARD.value
+)
+
 COMMON_TRANSITIONS = {'FADE OUT.', 'CUT TO BLACK.', 'FADE TO BLACK.'}
 CHARACTER_ALLOWABLE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ _ÄÖÜ0123456789'
 
+# Matches any character not allowed in a character name; derived from
+# CHARACTER_ALLOWABLE so one C-level scan replaces the per-character
+# membership test.
+_NOT_CHARACTER_RE = re.compile('[^' + re.escape(CHARACTER_ALLOWABLE) + ']')
+
+# Classifies a line by its leading characters in a single scan.
+# The alternatives are ordered to match the precedence of the old
+# branch-per-prefix chain, e.g. a page break must win over a synopsis.
+_LINE_RE = re.compile(
+    r'(?P<page_break>===)'
+    r'|(?P<synopsis>=)'
+    r'|(?P<section>#)'
+    r'|(?P<scene_forced>\.[^.])'
+    r'|(?P<action_forced>!.)'
+    r'|(?P<transition_forced>>)'
+)
+
+# Every alternative in _LINE_RE begins with one of these characters, so
+# the vast majority of lines (action and dialogue) can skip the regex
+# after a single O(1) set probe on the first character.
+_LINE_STARTS = frozenset('=#.!>')
+
+# Splits a title-page line into either a continuation (leading
+# whitespace) or a key with an optional inline value.
+_HEAD_RE = re.compile(r'(\s+)(.*)|([^:]+?)\s*:\s*(.*)')
+
+# Deletion table that strips carriage returns in one C pass.
+_CR_TABLE = str.maketrans('', '', '\r')
+
+# Sentinel lines left behind by the boneyard pre-pass; see
+# Fountain._extract_boneyards.
+_BONEYARD_MARK = '\x00'
+_BONEYARD_SKIP = '\x01'
+
+# Scene headings are recognized with tuple startswith calls, which scan
+# at C level without allocating slices or uppercased copies. Headings in
+# unusual mixed case ('InT.') fall back to the regex.
+_SCENE_STARTS = frozenset('IEie')
+_SCENE_PREFIXES = (
+    'INT ', 'INT.', 'EXT ', 'EXT.', 'EST ', 'EST.', 'I/E ', 'I/E.',
+    'INT/EXT ', 'INT/EXT.', 'INT./EXT ', 'INT./EXT.'
+)
+_SCENE_PREFIXES_LOWER = tuple(p.lower() for p in _SCENE_PREFIXES)
+_SCENE_HEADING_RE = re.compile(r'(?i:INT\./EXT|INT/EXT|INT|EXT|EST|I/E)[. ]')
+
+
+# The classifier is specialized at definition time: everything it
+# touches is bound as a default argument, so the per-line call runs on
+# locals only, with the common no-match case rejected by a set probe.
+def _classify_line(
+    line,
+    _scene_starts=_SCENE_STARTS,
+    _line_starts=_LINE_STARTS,
+    _scene_prefixes=_SCENE_PREFIXES,
+    _scene_prefixes_lower=_SCENE_PREFIXES_LOWER,
+    _scene_match=_SCENE_HEADING_RE.match,
+    _line_match=_LINE_RE.match,
+):
+    first = line[0]
+    if first in _scene_starts:
+        if (line.startswith(_scene_prefixes)
+                or line.startswith(_scene_prefixes_lower)
+                or _scene_match(line)):
+            return 'scene_heading'
+        return None
+    if first in _line_starts:
+        match = _line_match(line)
+        if match:
+            return match.lastgroup
+    return None
+
+# Tokenizes element text into escaped characters, star runs, underline
+# markers and plain text runs, so formatting can be resolved without a
+# character-by-character Python loop.
+_CHUNK_RE = re.compile(r'\\(.)|(\*+)|(_)|([^\\*_]+)', re.DOTALL)
+
 
 def strip_slashes(text):
     return text.replace("\\","")
 
 class FountainChunk:
+    __slots__ = ('bold', 'italic', 'underline', 'text')
+
     def __init__(self, bold=False, italic=False, underline=False):
         self.bold = bold
         self.italic = italic
@@ -67,6 +162,15 @@ class FountainChunk:
 
                 
 class FountainElement:
+    # a feature-length script produces thousands of these, so avoid a
+    # per-instance __dict__
+    __slots__ = (
+        'element_type', 'element_text', 'section_depth', 'scene_number',
+        'scene_abbreviation', 'is_centered', 'is_dual_dialogue',
+        'original_line', 'original_content', '_text_parts', '_orig_parts',
+        '_is_empty'
+    )
+
     def __init__(
         self,
         element_type,
@@ -88,85 +192,139 @@ class FountainElement:
         self.is_dual_dialogue = is_dual_dialogue
         self.original_line = original_line
         self.original_content = original_content
+        self._text_parts = None
+        self._orig_parts = None
+        # element_type never changes, so emptiness is decided once here
+        self._is_empty = bool(_EMPTY_MASK >> element_type.value & 1)
+
+    # the parser buffers continuation lines here instead of re-joining
+    # the accumulated text on every line; joined once when the element
+    # is complete
+    def _flush_parts(self):
+        if self._text_parts is not None:
+            self.element_text = '\n'.join(
+                [self.element_text, *self._text_parts])
+            self._text_parts = None
+        if self._orig_parts is not None:
+            self.original_content = '\n'.join(
+                [self.original_content, *self._orig_parts])
+            self._orig_parts = None
 
     def is_empty(self):
-        return (self.element_type == Element.EMPTY 
-                or self.element_type == Element.PAGE_BREAK
-                or self.element_type == Element.BONEYARD)
+        return self._is_empty
 
     # take the element_text and split it into
     # formatted chunks
     def split_to_chunks(self):
-        
+        if _tokenize_chunks is not None:
+            return self._split_to_chunks_numba()
+
         # This is very simple and will choke on
         # invalid nesting
         chunk = FountainChunk()
-        chunks  = [chunk]
-                                
-        is_escaped = False
+        chunks = [chunk]
+
+        parts = []
         stars = ""
-        
-        for c in self.element_text:
-            if is_escaped:
-                is_escaped = False
-                chunk.text+=c
-                continue
-                                                
-            if stars!="" and c!=stars[0]:            
-                new_chunk = chunk.copy()
-
-                if stars=="***":
-                    new_chunk.bold = not chunk.bold
-                    new_chunk.italic = not chunk.italic
-                elif stars=="**":
-                    new_chunk.bold = not chunk.bold
-                elif stars=="*":
-                    new_chunk.italic = not chunk.italic
-                                
-                chunks.append(new_chunk)
-
-                chunk = new_chunk
+
+        for match in _CHUNK_RE.finditer(self.element_text):
+            group = match.lastindex
+
+            if stars and group != 2:
+                # a pending star run is closed by any other token; runs
+                # longer than three stars have no meaning and are dropped
+                if len(stars) <= 3:
+                    if parts:
+                        chunk.text = ''.join(parts)
+                        parts = []
+                        chunk = chunk.copy()
+                        chunks.append(chunk)
+                    if stars == "***":
+                        chunk.bold = not chunk.bold
+                        chunk.italic = not chunk.italic
+                    elif stars == "**":
+                        chunk.bold = not chunk.bold
+                    else:
+                        chunk.italic = not chunk.italic
                 stars = ""
-                                                                
-            if c=='\\':
-                is_escaped = True
-                continue
-                                                                                            
-            if c=='_':
-                new_chunk = chunk.copy()
-                new_chunk.underline = not chunk.underline
-                chunks.append(new_chunk)
-                chunk = new_chunk
-                continue
 
-            if c=='*':
-                stars+=c
-                continue
-                            
-            chunk.text+=c
+            if group == 2:
+                stars += match.group(2)
+            elif group == 3:
+                if parts:
+                    chunk.text = ''.join(parts)
+                    parts = []
+                    chunk = chunk.copy()
+                    chunks.append(chunk)
+                chunk.underline = not chunk.underline
+            elif group == 1:
+                parts.append(match.group(1))
+            else:
+                parts.append(match.group(4))
+
+        chunk.text = ''.join(parts)
+        return chunks
+
+    # compiled fast path: tokenize over the UTF-8 bytes, then fold the
+    # emitted (start, length, flags) rows back into chunks
+    def _split_to_chunks_numba(self):
+        data = self.element_text.encode('utf-8')
+        segs = _tokenize_chunks(_np.frombuffer(data, dtype=_np.uint8))
 
+        # slice segments through a memoryview so nothing is copied
+        # until the final per-chunk join and decode
+        view = memoryview(data)
+        chunk = FountainChunk()
+        chunks = [chunk]
+        flags = 0
+        parts = []
+
+        for row in range(segs.shape[0]):
+            seg_flags = segs[row, 2]
+            if seg_flags != flags:
+                if parts:
+                    chunk.text = b''.join(parts).decode('utf-8')
+                    parts = []
+                    chunk = chunk.copy()
+                    chunks.append(chunk)
+                chunk.bold = bool(seg_flags & 1)
+                chunk.italic = bool(seg_flags & 2)
+                chunk.underline = bool(seg_flags & 4)
+                flags = seg_flags
+            length = segs[row, 1]
+            if length:
+                start = segs[row, 0]
+                parts.append(view[start:start + length])
+
+        chunk.text = b''.join(parts).decode('utf-8')
         return chunks
 
     def __repr__(self):
         return self.element_type + ': ' + self.element_text
 
 class FountainScene:
+    __slots__ = ('header_text', 'elements', '_non_empty')
+
     def __init__(self, scene_header_text=""):
         self.header_text = strip_slashes(scene_header_text)
         self.elements = list()
+        self._non_empty = 0
 
     def append(self, element):
         self.elements.append(element)
+        if not element._is_empty:
+            self._non_empty += 1
 
     def is_empty(self):
-        for element in self.elements:
-            if not element.is_empty():
-                return False
-        return True
+        return self._non_empty == 0
     
 
 class Fountain:
-    def __init__(self, string=None, path=None):
+    # keep_original retains the unparsed text of every line on its
+    # element; off by default since it roughly doubles the memory held
+    # by the parsed model
+    def __init__(self, string=None, path=None, keep_original=False):
+        self.keep_original = keep_original
         self.metadata = dict()
         self.elements = list()
         self.scenes = list()
@@ -180,9 +338,12 @@ class Fountain:
             self.parse()
 
     def parse(self):
-        contents = self.contents.strip().replace('\r', '')
+        contents = self.contents.translate(_CR_TABLE).strip()
 
-        contents_has_metadata = ':' in contents.splitlines()[0]
+        first_newline = contents.find('\n')
+        first_line = contents if first_newline == -1 \
+            else contents[:first_newline]
+        contents_has_metadata = ':' in first_line
         contents_has_body = '\n\n' in contents
 
         if contents_has_metadata and contents_has_body:
@@ -198,89 +359,131 @@ class Fountain:
         open_key = None
         for line in script_head:
             line = line.rstrip()
-            if line[0].isspace():
-                self.metadata[open_key].append(line.strip())
-            elif line[-1] == ':':
+            match = _HEAD_RE.match(line)
+            if not match:
+                continue
+            if match.group(1) is not None:
+                # continuation line; ignored when no key is open yet
+                if open_key is not None:
+                    self.metadata[open_key].append(match.group(2))
+            elif line.endswith(':'):
+                # a trailing colon opens a multi-line key even when the
+                # line holds an inline value, e.g. 'Note: draft v2:'
                 open_key = line[0:-1].lower()
                 self.metadata[open_key] = list()
             else:
-                key, value = line.split(':', 1)
-                self.metadata[key.strip().lower()] = [value.strip()]
+                self.metadata[match.group(3).lower()] = [match.group(4)]
+
+    def _append_element(self, element):
+        if self.elements:
+            self.elements[-1]._flush_parts()
+        if not self.keep_original:
+            element.original_content = ''
+        self.elements.append(element)
 
     def _add_scene(self, scene_header_elem):
         last_scene = self.scenes[-1]
         if last_scene.is_empty():
             self.scenes.pop()
         new_scene = FountainScene(scene_header_elem.element_text)
-        new_scene.elements.append(scene_header_elem)
+        new_scene.append(scene_header_elem)
         self.scenes.append(new_scene)
         return new_scene
 
+    # Boneyards (/* ... */) are extracted before the per-line loop so
+    # the loop does not have to carry comment-block state. Each block
+    # collapses to one marker line, where its element is emitted, plus
+    # skip lines that keep the original line numbering.
+    def _extract_boneyards(self, script_body):
+        boneyards = []
+        i = 0
+        count = len(script_body)
+        while i < count:
+            line = script_body[i].lstrip()
+            if line.startswith('/*'):
+                line = line.rstrip()
+                if line.endswith('*/'):
+                    boneyards.append(
+                        (line.replace('/*', '').replace('*/', ''), line))
+                    script_body[i] = _BONEYARD_MARK + str(len(boneyards) - 1)
+                else:
+                    comment_text = ['']
+                    j = i + 1
+                    while j < count:
+                        interior = script_body[j].lstrip()
+                        if interior.rstrip().endswith('*/'):
+                            break
+                        comment_text.append(interior)
+                        j += 1
+                    for k in range(i, j):
+                        script_body[k] = _BONEYARD_SKIP
+                    if j < count:
+                        closing = script_body[j].lstrip()
+                        comment_text.append(closing.replace('*/', '').strip())
+                        boneyards.append(
+                            ('\n'.join(comment_text), closing))
+                        script_body[j] = \
+                            _BONEYARD_MARK + str(len(boneyards) - 1)
+                    i = j
+            elif line.rstrip().endswith('*/'):
+                # a stray closing marker is still swallowed as a boneyard
+                boneyards.append((line.replace('*/', '').strip(), line))
+                script_body[i] = _BONEYARD_MARK + str(len(boneyards) - 1)
+            i += 1
+        return boneyards
+
     def _parse_body(self, script_body):
-        is_comment_block = False
         is_inside_dialogue_block = False
         newlines_before = 0
-        index = -1
-        comment_text = list()
         curr_scene = FountainScene()
         self.scenes = [curr_scene]
 
-        for linenum, line in enumerate(script_body):
+        # blank lines are extremely common; EMPTY elements carry no
+        # line-specific data and the parser never mutates one, so one
+        # cached instance per parse covers them all without aliasing
+        # elements across documents
+        empty_element = FountainElement(Element.EMPTY)
+
+        boneyards = self._extract_boneyards(script_body)
+        # line has no leading whitespace after this, so the full strip
+        # only removes trailing whitespace and a whitespace-only line
+        # becomes empty
+        lstripped_lines = [line.lstrip() for line in script_body]
+        stripped_lines = [line.rstrip() for line in lstripped_lines]
+        count = len(script_body)
+
+        for linenum, line in enumerate(lstripped_lines):
             assert type(line) is str
-            index += 1
-            line = line.lstrip()
-            full_strip = line.strip()
+            full_strip = stripped_lines[linenum]
 
-            if (not line or line.isspace()) and not is_comment_block:
-                self.elements.append(FountainElement(Element.EMPTY))
+            if not line:
+                self._append_element(empty_element)
                 curr_scene.append(self.elements[-1])
                 is_inside_dialogue_block = False
                 newlines_before += 1
                 continue
 
-            if line.startswith('/*'):
-                line = line.rstrip()
-                if line.endswith('*/'):
-                    text = line.replace('/*', '').replace('*/', '')
-                    self.elements.append(
-                        FountainElement(
-                            Element.BONEYARD,
-                            text,
-                            original_line=linenum,
-                            original_content=line
-                        )
-                    )
-                    curr_scene.append(self.elements[-1])
-                    is_comment_block = False
-                    newlines_before = 0
-                else:
-                    is_comment_block = True
-                    comment_text.append('')
+            if line[0] == _BONEYARD_SKIP:
                 continue
 
-            if line.rstrip().endswith('*/'):
-                text = line.replace('*/', '')
-                comment_text.append(text.strip())
-                self.elements.append(
+            if line[0] == _BONEYARD_MARK:
+                text, content = boneyards[int(line[1:])]
+                self._append_element(
                     FountainElement(
                         Element.BONEYARD,
-                        '\n'.join(comment_text),
+                        text,
                         original_line=linenum,
-                        original_content=line
+                        original_content=content
                     )
                 )
                 curr_scene.append(self.elements[-1])
-                is_comment_block = False
-                comment_text = list()
                 newlines_before = 0
                 continue
 
-            if is_comment_block:
-                comment_text.append(line)
-                continue
+            kind = _classify_line(line)
 
-            if line.startswith('==='):
-                self.elements.append(
+            if kind == 'page_break':
+                self._append_element(
                     FountainElement(
                         Element.PAGE_BREAK,
                         line,
@@ -292,8 +495,8 @@ class Fountain:
                 newlines_before = 0
                 continue
 
-            if len(full_strip) > 0 and full_strip[0] == '=':
-                self.elements.append(
+            if kind == 'synopsis':
+                self._append_element(
                     FountainElement(
                         Element.SYNOPSIS,
                         full_strip[1:].strip(),
@@ -309,7 +512,7 @@ class Fountain:
                 and full_strip.startswith('[[')
                 and full_strip.endswith(']]')
             ):
-                self.elements.append(
+                self._append_element(
                     FountainElement(
                         Element.COMMENT,
                         full_strip.strip('[] \t'),
@@ -320,10 +523,10 @@ class Fountain:
                 curr_scene.append(self.elements[-1])
                 continue
 
-            if len(full_strip) > 0 and full_strip[0] == '#':
+            if kind == 'section':
                 newlines_before = 0
                 depth = full_strip.split()[0].count('#')
-                self.elements.append(
+                self._append_element(
                     FountainElement(
                         Element.SECTION_HEADING,
                         full_strip[depth:].strip(),
@@ -335,12 +538,12 @@ class Fountain:
                 curr_scene.append(self.elements[-1])
                 continue
 
-            if len(line) > 1 and line[0] == '.' and line[1] != '.':
+            if kind == 'scene_forced':
                 newlines_before = 0
                 if full_strip[-1] == '#' and full_strip.count('#') > 1:
-                    scene_number_start = len(full_strip) - \
-                        full_strip[::-1].find('#', 1) - 1
-                    self.elements.append(
+                    scene_number_start = full_strip.rfind(
+                        '#', 0, len(full_strip) - 1)
+                    self._append_element(
                         FountainElement(
                             Element.SCENE_HEADING,
                             full_strip[1:scene_number_start].strip(),
@@ -353,7 +556,7 @@ class Fountain:
                     )
                     curr_scene = self._add_scene(self.elements[-1])
                 else:
-                    self.elements.append(
+                    self._append_element(
                         FountainElement(
                             Element.SCENE_HEADING,
                             full_strip[1:].strip(),
@@ -364,8 +567,8 @@ class Fountain:
                     curr_scene = self._add_scene(self.elements[-1])
                 continue
 
-            if len(line) > 1 and line[0] == '!':
-                self.elements.append(
+            if kind == 'action_forced':
+                self._append_element(
                     FountainElement(
                         Element.ACTION,
                         full_strip[1:].strip(),
@@ -376,39 +579,36 @@ class Fountain:
                 curr_scene.append(self.elements[-1])
                 continue
 
-            if (
-                line[0:4].upper() in
-                ['INT ', 'INT.', 'EXT ', 'EXT.', 'EST ', 'EST.', 'I/E ', 'I/E.']
-                or line[0:8].upper() in ['INT/EXT ', 'INT/EXT.']
-                or line[0:9].upper() in ['INT./EXT ', 'INT./EXT.']
-            ):
+            if kind == 'scene_heading':
                 newlines_before = 0
-                scene_name_start = line.find(line.split()[1])
+                parts = line.split(maxsplit=2)
+                abbreviation = parts[0]
+                scene_name_start = line.find(parts[1]) if len(parts) > 1 else 0
                 if full_strip[-1] == '#' and full_strip.count('#') > 1:
-                    scene_number_start = len(full_strip) - \
-                        full_strip[::-1].find('#', 1) - 1
-                    self.elements.append(
+                    scene_number_start = full_strip.rfind(
+                        '#', 0, len(full_strip) - 1)
+                    self._append_element(
                         FountainElement(
                             Element.SCENE_HEADING,
-                            line.split()[0]+" "+full_strip[
+                            abbreviation+" "+full_strip[
                                 scene_name_start:scene_number_start
                             ].strip(),
                             scene_number=full_strip[
                                 scene_number_start:
                             ].strip('#').strip(),
                             original_line=linenum,
-                            scene_abbreviation=line.split()[0],
+                            scene_abbreviation=abbreviation,
                             original_content=line
                         )
                     )
                     curr_scene = self._add_scene(self.elements[-1])
                 else:
-                    self.elements.append(
+                    self._append_element(
                         FountainElement(
                             Element.SCENE_HEADING,
-                            line.split()[0]+" "+full_strip[scene_name_start:].strip(),
+                            abbreviation+" "+full_strip[scene_name_start:].strip(),
                             original_line=linenum,
-                            scene_abbreviation=line.split()[0],
+                            scene_abbreviation=abbreviation,
                             original_content=line
                         )
                     )
@@ -417,7 +617,7 @@ class Fountain:
 
             if full_strip.endswith(' TO:'):
                 newlines_before = 0
-                self.elements.append(
+                self._append_element(
                     FountainElement(
                         Element.TRANSITION,
                         full_strip,
@@ -430,7 +630,7 @@ class Fountain:
 
             if full_strip in COMMON_TRANSITIONS:
                 newlines_before = 0
-                self.elements.append(
+                self._append_element(
                     FountainElement(
                         Element.TRANSITION,
                         full_strip,
@@ -441,10 +641,10 @@ class Fountain:
                 curr_scene.append(self.elements[-1])
                 continue
 
-            if full_strip[0] == '>':
+            if kind == 'transition_forced':
                 newlines_before = 0
                 if len(full_strip) > 1 and full_strip[-1] == '<':
-                    self.elements.append(
+                    self._append_element(
                         FountainElement(
                             Element.ACTION,
                             full_strip[1:-1].strip(),
@@ -455,7 +655,7 @@ class Fountain:
                     )
                     curr_scene.append(self.elements[-1])
                 else:
-                    self.elements.append(
+                    self._append_element(
                         FountainElement(
                             Element.TRANSITION,
                             full_strip[1:].strip(),
@@ -468,10 +668,10 @@ class Fountain:
 
             if (
                 newlines_before > 0
-                and index + 1 < len(script_body)
-                and script_body[index + 1]
+                and linenum + 1 < count
+                and script_body[linenum + 1]
                 and not line[0] in ['[', ']', ',', '(', ')']
-                and (all([(c in CHARACTER_ALLOWABLE) for c in full_strip])
+                and (not _NOT_CHARACTER_RE.search(full_strip)
                      or full_strip[0] == '@')
             ):
                 newlines_before = 0
@@ -480,7 +680,7 @@ class Fountain:
                         if element.element_type == Element.CHARACTER:
                             element.is_dual_dialogue = True
                             break
-                    self.elements.append(
+                    self._append_element(
                         FountainElement(
                             Element.CHARACTER,
                             full_strip.lstrip('@').rstrip('^').strip(),
@@ -492,7 +692,7 @@ class Fountain:
                     curr_scene.append(self.elements[-1])
                     is_inside_dialogue_block = True
                 else:
-                    self.elements.append(
+                    self._append_element(
                         FountainElement(
                             Element.CHARACTER,
                             full_strip.lstrip('@'),
@@ -506,7 +706,7 @@ class Fountain:
 
             if is_inside_dialogue_block:
                 if newlines_before == 0 and full_strip[0] == '(':
-                    self.elements.append(
+                    self._append_element(
                         FountainElement(
                             Element.PARENTHETICAL,
                             full_strip,
@@ -517,14 +717,16 @@ class Fountain:
                     curr_scene.append(self.elements[-1])
                 else:
                     if self.elements[-1].element_type == Element.DIALOGUE:
-                        self.elements[-1].element_text = '\n'.join(
-                            [self.elements[-1].element_text, full_strip]
-                        )
-                        self.elements[-1].original_content = '\n'.join(
-                            [self.elements[-1].original_content, line]
-                        )
+                        last = self.elements[-1]
+                        if last._text_parts is None:
+                            last._text_parts = []
+                        last._text_parts.append(full_strip)
+                        if self.keep_original:
+                            if last._orig_parts is None:
+                                last._orig_parts = []
+                            last._orig_parts.append(line)
                     else:
-                        self.elements.append(
+                        self._append_element(
                             FountainElement(
                                 Element.DIALOGUE,
                                 full_strip,
@@ -536,11 +738,13 @@ class Fountain:
                 continue
 
             if newlines_before == 0 and len(self.elements) > 0:
-                self.elements[-1].element_text = '\n'.join(
-                    [self.elements[-1].element_text, full_strip])
+                last = self.elements[-1]
+                if last._text_parts is None:
+                    last._text_parts = []
+                last._text_parts.append(full_strip)
                 newlines_before = 0
             else:
-                self.elements.append(
+                self._append_element(
                     FountainElement(
                         Element.ACTION,
                         full_strip,
@@ -550,3 +754,6 @@ class Fountain:
                 )
                 curr_scene.append(self.elements[-1])
                 newlines_before = 0
+
+        if self.elements:
+            self.elements[-1]._flush_parts()